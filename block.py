@@ -1,24 +1,74 @@
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import json
-from hash_utils import calculate_hash
+import multiprocessing
+import os
+import queue
+import time
+from hash_utils import (
+    calculate_hash, digest_from_hex, encode_block, encode_block_parts, find_nonce
+)
 from transaction import Transaction
 
 
+# Seconds the parent waits for a result before checking its workers are alive
+RESULT_POLL_SECONDS = 0.1
+
+
+def _mine_worker(
+    prefix: bytes,
+    suffix: bytes,
+    difficulty: int,
+    start: int,
+    step: int,
+    found: Any,
+    results: Any
+) -> None:
+    """
+    Search one stripe of the nonce space for a parallel mining run.
+    
+    Args:
+        prefix: Serialized block data preceding the nonce
+        suffix: Serialized block data following the nonce
+        difficulty: Number of leading zeros required in hash
+        start: First nonce of this worker's stripe
+        step: Distance between nonces in the stripe (number of workers)
+        found: Event set by whichever worker finds a valid nonce first
+        results: Queue receiving (nonce, hash) tuples
+    """
+    result = find_nonce(prefix, suffix, difficulty, start, step, found)
+    if result is not None:
+        results.put(result)
+        found.set()
+
+
 class Block:
     """
     Represents a block in the blockchain.
     
     Attributes:
         index (int): Position of block in the chain
-        timestamp (str): When block was created
+        timestamp (int): When block was created (nanoseconds since epoch)
         transactions (List[Transaction]): List of transactions in block
         previous_hash (str): Hash of the previous block
         hash (str): Current block's hash
         nonce (int): Number used once for Proof of Work
         difficulty (int): Number of leading zeros required in hash
+    
+    The canonical encoding and raw digest are cached for revalidation.
+    Reassigning a hashed field or ``hash`` discards the matching cache, and
+    the encoding is rebuilt whenever a transaction's encoding changes.
     """
     
+    __slots__ = (
+        'index', 'timestamp', 'transactions', 'previous_hash',
+        'difficulty', 'nonce', 'hash',
+        '_canonical_bytes', '_tx_json', '_hash_bytes'
+    )
+    
+    _HASHED_FIELDS = frozenset(
+        ('index', 'timestamp', 'transactions', 'previous_hash', 'nonce')
+    )
+    
     def __init__(
         self,
         index: int,
@@ -35,14 +85,27 @@ class Block:
             previous_hash: Hash of previous block
             difficulty: Proof of Work difficulty (leading zeros)
         """
+        self._canonical_bytes: Optional[bytes] = None
+        self._tx_json: Optional[List[bytes]] = None
+        self._hash_bytes: Optional[bytes] = None
         self.index = index
-        self.timestamp = datetime.now().isoformat()
+        self.timestamp = time.time_ns()
         self.transactions = transactions
         self.previous_hash = previous_hash
         self.difficulty = difficulty
         self.nonce = 0
         self.hash = self.calculate_hash()
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Set an attribute, invalidating cached encodings if a hashed field changes.
+        """
+        if name in self._HASHED_FIELDS:
+            object.__setattr__(self, '_canonical_bytes', None)
+        elif name == 'hash':
+            object.__setattr__(self, '_hash_bytes', None)
+        object.__setattr__(self, name, value)
+    
     def calculate_hash(self) -> str:
         """
         Calculate SHA-256 hash of block data.
@@ -50,24 +113,116 @@ class Block:
         Returns:
             Hexadecimal hash string
         """
-        block_data = {
-            'index': self.index,
-            'timestamp': self.timestamp,
-            'transactions': [tx.to_dict() for tx in self.transactions],
-            'previous_hash': self.previous_hash,
-            'nonce': self.nonce
-        }
-        return calculate_hash(block_data)
+        return calculate_hash(self.canonical_json())
+    
+    def canonical_json(self) -> bytes:
+        """
+        Get the canonical JSON encoding of the hashed block fields.
+        
+        Returns:
+            Canonical JSON bytes
+        """
+        tx_json = [tx.canonical_json() for tx in self.transactions]
+        if self._canonical_bytes is None or tx_json != self._tx_json:
+            self._tx_json = tx_json
+            self._canonical_bytes = encode_block(
+                self.index,
+                self.timestamp,
+                tx_json,
+                self.previous_hash,
+                self.nonce
+            )
+        return self._canonical_bytes
+    
+    def hash_bytes(self) -> bytes:
+        """
+        Get the block's stored hash as a raw digest.
+        
+        Returns:
+            Raw 32-byte digest of ``hash``
+        
+        Raises:
+            TypeError: If ``hash`` is not a string
+            ValueError: If ``hash`` is not 64 lowercase hexadecimal characters
+        """
+        if self._hash_bytes is None:
+            self._hash_bytes = digest_from_hex(self.hash)
+        return self._hash_bytes
+    
+    def _hash_parts(self) -> Tuple[bytes, bytes]:
+        """
+        Serialize the hashed block fields split around the nonce value.
+        
+        Returns:
+            Tuple of (prefix, suffix) bytes surrounding the nonce digits
+        """
+        return encode_block_parts(
+            self.index,
+            self.timestamp,
+            [tx.canonical_json() for tx in self.transactions],
+            self.previous_hash
+        )
     
     def mine_block(self) -> None:
         """
         Mine the block using Proof of Work (simple difficulty).
         Incrementally adjusts nonce until hash meets difficulty requirement.
         """
-        target = '0' * self.difficulty
-        while self.hash[:self.difficulty] != target:
-            self.nonce += 1
-            self.hash = self.calculate_hash()
+        if self.is_valid_proof_of_work():
+            return
+        prefix, suffix = self._hash_parts()
+        self.nonce, self.hash = find_nonce(
+            prefix, suffix, self.difficulty, start=self.nonce + 1
+        )
+    
+    def mine_block_parallel(self, n_workers: Optional[int] = None) -> None:
+        """
+        Mine the block using Proof of Work across several processes.
+        Worker k tries nonces k, k + n, k + 2n, ... until any worker succeeds.
+        
+        Args:
+            n_workers: Number of worker processes (defaults to CPU count)
+        
+        Raises:
+            RuntimeError: If every worker exits without reporting a nonce
+        """
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if n_workers <= 1 or self.is_valid_proof_of_work():
+            self.mine_block()
+            return
+        
+        prefix, suffix = self._hash_parts()
+        found = multiprocessing.Event()
+        results = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(
+                target=_mine_worker,
+                args=(prefix, suffix, self.difficulty, self.nonce + 1 + k,
+                      n_workers, found, results),
+                daemon=True
+            )
+            for k in range(n_workers)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            while True:
+                # Sample liveness before waiting, so a result posted by the
+                # last worker to exit is still collected by this get()
+                any_alive = any(worker.is_alive() for worker in workers)
+                try:
+                    self.nonce, self.hash = results.get(timeout=RESULT_POLL_SECONDS)
+                    break
+                except queue.Empty:
+                    if not any_alive:
+                        raise RuntimeError(
+                            "all mining workers exited without finding a nonce"
+                        )
+        finally:
+            found.set()
+            for worker in workers:
+                worker.join()
     
     def is_valid_proof_of_work(self) -> bool:
         """
@@ -98,13 +253,22 @@ class Block:
     
     def to_json(self) -> str:
         """
-        Convert block to JSON string.
+        Convert block to an indented JSON string for human display.
         
         Returns:
             JSON string representation
         """
         return json.dumps(self.to_dict(), indent=2)
     
+    def to_wire_json(self) -> str:
+        """
+        Convert block to a compact, key-sorted JSON string for transfer.
+        
+        Returns:
+            JSON string representation without insignificant whitespace
+        """
+        return json.dumps(self.to_dict(), separators=(',', ':'), sort_keys=True)
+    
     def __repr__(self) -> str:
         """
         String representation of block.
@@ -1,8 +1,18 @@
-from typing import List
+import itertools
+from operator import attrgetter, methodcaller
+from typing import Iterator, List
 from block import Block
+from hash_utils import difficulty_target, digest_from_hex, sha256_batch
 from transaction import Transaction
 
 
+# Accessors used when sweeping over every block during validation
+_hash_bytes = methodcaller('hash_bytes')
+_canonical_json = methodcaller('canonical_json')
+_previous_hash = attrgetter('previous_hash')
+_difficulty = attrgetter('difficulty')
+
+
 class Blockchain:
     """
     Represents the blockchain - a chain of validated blocks.
@@ -75,6 +85,43 @@ class Blockchain:
         self.chain.append(new_block)
         return new_block
     
+    def add_blocks(
+        self,
+        transaction_lists: List[List[Transaction]],
+        n_workers: int = 1
+    ) -> List[Block]:
+        """
+        Create, mine and add several blocks in order.
+        
+        Each block links to the one mined before it, so blocks are mined one
+        after another; with n_workers > 1 each block's nonce search is spread
+        across processes. The chain grows once at the end.
+        
+        Args:
+            transaction_lists: Transactions for each new block
+            n_workers: Number of processes used to mine each block
+        
+        Returns:
+            The newly created and mined blocks
+        """
+        index = len(self.chain)
+        previous_hash = self.chain[-1].hash
+        new_blocks = []
+        
+        for offset, transactions in enumerate(transaction_lists):
+            new_block = Block(
+                index=index + offset,
+                transactions=transactions,
+                previous_hash=previous_hash,
+                difficulty=self.difficulty
+            )
+            new_block.mine_block_parallel(n_workers)
+            new_blocks.append(new_block)
+            previous_hash = new_block.hash
+        
+        self.chain.extend(new_blocks)
+        return new_blocks
+    
     def get_latest_block(self) -> Block:
         """
         Get the last block in the chain.
@@ -91,24 +138,42 @@ class Blockchain:
         Returns:
             True if chain is valid, False if tampering detected
         """
-        # Check each block except genesis
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i - 1]
-            
-            # Verify current block's hash
-            if current_block.hash != current_block.calculate_hash():
-                return False
-            
-            # Verify current block references previous block correctly
-            if current_block.previous_hash != previous_block.hash:
+        chain = self.chain
+        blocks = chain[1:]
+        
+        # Gather each block's stored hash and previous_hash as contiguous
+        # raw digests so whole runs can be compared at once
+        try:
+            stored = b''.join(map(_hash_bytes, chain))
+            linked = b''.join(map(digest_from_hex, map(_previous_hash, blocks)))
+        except (TypeError, ValueError):
+            return False
+        
+        # Cheap structural checks first, so tampering with hashes or links
+        # is rejected before any block is re-hashed: each block's
+        # previous_hash must be its predecessor's hash
+        if linked != stored[:-32]:
+            return False
+        
+        # Verify Proof of Work
+        from_bytes = int.from_bytes
+        for offset, difficulty in enumerate(map(_difficulty, blocks), 1):
+            try:
+                target = difficulty_target(difficulty)
+            except ValueError:
+                # Difficulty no hash could satisfy (or a negative one)
                 return False
-            
-            # Verify Proof of Work
-            if not current_block.is_valid_proof_of_work():
+            digest = stored[32 * offset:32 * (offset + 1)]
+            if from_bytes(digest, 'big') >= target:
                 return False
         
-        return True
+        # Recalculate every block's hash (except genesis) in one batch
+        try:
+            computed = b''.join(sha256_batch(map(_canonical_json, blocks)))
+        except TypeError:
+            # A hashed field was replaced with a value of the wrong type
+            return False
+        return computed == stored[32:]
     
     def get_chain_length(self) -> int:
         """
@@ -119,6 +184,17 @@ class Blockchain:
         """
         return len(self.chain)
     
+    def iter_all_transactions(self) -> Iterator[Transaction]:
+        """
+        Iterate over all transactions from all blocks in the chain.
+        
+        Returns:
+            Iterator yielding transactions in chain order
+        """
+        return itertools.chain.from_iterable(
+            block.transactions for block in self.chain
+        )
+    
     def get_all_transactions(self) -> List[Transaction]:
         """
         Get all transactions from all blocks in the chain.
@@ -126,7 +202,4 @@ class Blockchain:
         Returns:
             List of all transactions
         """
-        all_transactions = []
-        for block in self.chain:
-            all_transactions.extend(block.transactions)
-        return all_transactions
+        return list(self.iter_all_transactions())
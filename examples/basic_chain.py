@@ -43,7 +43,8 @@ def main():
     # Get chain info
     print("Chain Summary:")
     print(f"  Total blocks: {blockchain.get_chain_length()}")
-    print(f"  Total transactions: {len(blockchain.get_all_transactions())}")
+    tx_count = sum(len(block.transactions) for block in blockchain.chain)
+    print(f"  Total transactions: {tx_count}")
     print(f"  Latest block hash: {blockchain.get_latest_block().hash}")
 
 if __name__ == '__main__':
@@ -1,26 +1,38 @@
 import hashlib
 import json
-from typing import Any, Union
+from json.encoder import encode_basestring_ascii
+from typing import Any, Iterable, List, Optional, Tuple, Union
 
 
-def calculate_hash(data: Union[str, dict, list], encoding: str = 'utf-8') -> str:
+# Bound once at import: hashlib's OpenSSL-backed constructor already selects
+# the SHA-NI code path at runtime on CPUs that support it.
+sha256 = hashlib.sha256
+
+# Number of nonces tried between checks of a parallel search's stop flag
+NONCE_POLL_INTERVAL = 1 << 16
+
+
+def calculate_hash(data: Union[bytes, str, dict, list], encoding: str = 'utf-8') -> str:
     """
     Calculate SHA-256 hash of input data.
     
     Args:
-        data: The data to hash (string, dict, or list)
+        data: The data to hash (bytes, string, dict, or list)
         encoding: Character encoding for string conversion
     
     Returns:
         Hexadecimal SHA-256 hash string
     """
+    if type(data) is bytes:
+        return sha256(data).hexdigest()
+    
     if isinstance(data, dict) or isinstance(data, list):
         data = json.dumps(data, sort_keys=True)
     
     if isinstance(data, str):
         data = data.encode(encoding)
     
-    return hashlib.sha256(data).hexdigest()
+    return sha256(data).hexdigest()
 
 
 def verify_hash(data: Union[str, dict, list], hash_value: str, encoding: str = 'utf-8') -> bool:
@@ -52,3 +64,252 @@ def double_hash(data: Union[str, dict, list], encoding: str = 'utf-8') -> str:
     """
     first_hash = calculate_hash(data, encoding)
     return calculate_hash(first_hash, encoding)
+
+
+def _encode_str(value: str) -> bytes:
+    """
+    Encode a string as a quoted, escaped JSON literal.
+    """
+    return encode_basestring_ascii(value).encode('ascii')
+
+
+def _encode_int(value: int) -> bytes:
+    """
+    Encode an integer as a JSON number literal.
+    
+    Raises:
+        TypeError: If value is not an int, rather than silently truncating it
+    """
+    if type(value) is not int:
+        raise TypeError(f"expected int, got {type(value).__name__}: {value!r}")
+    return b'%d' % value
+
+
+def encode_transaction(sender: str, receiver: str, amount: int, timestamp: int) -> bytes:
+    """
+    Encode transaction fields as canonical JSON bytes.
+    
+    Produces the same bytes as compact, key-sorted ``json.dumps`` of the
+    transaction dictionary without going through the generic encoder.
+    
+    Args:
+        sender: Address or ID of the sender
+        receiver: Address or ID of the receiver
+        amount: Amount being transferred, in minor units
+        timestamp: When the transaction occurred (nanoseconds since epoch)
+    
+    Returns:
+        Canonical JSON bytes
+    
+    Raises:
+        TypeError: If amount or timestamp is not an int
+    """
+    return b''.join((
+        b'{"amount":', _encode_int(amount),
+        b',"receiver":', _encode_str(receiver),
+        b',"sender":', _encode_str(sender),
+        b',"timestamp":', _encode_int(timestamp), b'}'
+    ))
+
+
+def encode_block_parts(
+    index: int,
+    timestamp: int,
+    tx_json_list: List[bytes],
+    previous_hash: str
+) -> Tuple[bytes, bytes]:
+    """
+    Encode block fields as canonical JSON bytes split around the nonce.
+    
+    The nonce is emitted as the last key so that everything ahead of it
+    forms a constant prefix whose SHA-256 state can be reused per attempt.
+    
+    Args:
+        index: Block's position in chain
+        timestamp: When block was created (nanoseconds since epoch)
+        tx_json_list: Canonical JSON bytes of each transaction
+        previous_hash: Hash of previous block
+    
+    Returns:
+        Tuple of (prefix, suffix) bytes surrounding the nonce digits
+    
+    Raises:
+        TypeError: If index or timestamp is not an int
+    """
+    prefix = b''.join((
+        b'{"index":', _encode_int(index),
+        b',"previous_hash":', _encode_str(previous_hash),
+        b',"timestamp":', _encode_int(timestamp),
+        b',"transactions":[', b','.join(tx_json_list),
+        b'],"nonce":'
+    ))
+    suffix = b'}'
+    return prefix, suffix
+
+
+def encode_block(
+    index: int,
+    timestamp: int,
+    tx_json_list: List[bytes],
+    previous_hash: str,
+    nonce: int
+) -> bytes:
+    """
+    Encode block fields as canonical JSON bytes.
+    
+    Args:
+        index: Block's position in chain
+        timestamp: When block was created (nanoseconds since epoch)
+        tx_json_list: Canonical JSON bytes of each transaction
+        previous_hash: Hash of previous block
+        nonce: Proof of Work nonce
+    
+    Returns:
+        Canonical JSON bytes
+    
+    Raises:
+        TypeError: If index, timestamp or nonce is not an int
+    """
+    prefix, suffix = encode_block_parts(index, timestamp, tx_json_list, previous_hash)
+    return b''.join((prefix, _encode_int(nonce), suffix))
+
+
+def digest_from_hex(hash_value: str) -> bytes:
+    """
+    Decode a hexadecimal SHA-256 hash into its raw 32-byte digest.
+    
+    Only the canonical form produced by ``hexdigest()`` is accepted, so two
+    different hash strings can never decode to the same digest.
+    
+    Args:
+        hash_value: Hash as 64 lowercase hexadecimal characters
+    
+    Returns:
+        Raw 32-byte digest
+    
+    Raises:
+        TypeError: If hash_value is not a string
+        ValueError: If hash_value is not 64 lowercase hexadecimal characters
+    """
+    digest = bytes.fromhex(hash_value)
+    if len(hash_value) != 64 or digest.hex() != hash_value:
+        raise ValueError(f"not a 64-character lowercase hex digest: {hash_value!r}")
+    return digest
+
+
+def sha256_64b(buf64: bytes) -> bytes:
+    """
+    Calculate the SHA-256 digest of exactly 64 bytes (two child digests).
+    
+    Every Merkle parent hashes a fixed 64-byte input, so this is the single
+    entry point where a kernel specialised for that size can be plugged in.
+    
+    Args:
+        buf64: Left digest followed by right digest
+    
+    Returns:
+        Raw 32-byte digest
+    
+    Raises:
+        ValueError: If the input is not 64 bytes long
+    """
+    if len(buf64) != 64:
+        raise ValueError(f"expected 64 bytes, got {len(buf64)}")
+    return sha256(buf64).digest()
+
+
+def sha256_64b_batch(buffers: Iterable[bytes]) -> List[bytes]:
+    """
+    Calculate SHA-256 digests of many 64-byte buffers in one call.
+    
+    Args:
+        buffers: Byte strings of exactly 64 bytes each
+    
+    Returns:
+        Raw 32-byte digests in the same order as the inputs
+    
+    Raises:
+        ValueError: If any input is not 64 bytes long
+    """
+    return [sha256_64b(buffer) for buffer in buffers]
+
+
+def sha256_batch(buffers: Iterable[bytes]) -> List[bytes]:
+    """
+    Calculate SHA-256 digests of many independent buffers in one call.
+    
+    Args:
+        buffers: Byte strings to hash
+    
+    Returns:
+        Raw 32-byte digests in the same order as the inputs
+    """
+    return [sha256(buffer).digest() for buffer in buffers]
+
+
+def difficulty_target(difficulty: int) -> int:
+    """
+    Get the exclusive upper bound for digests meeting a difficulty.
+    
+    A digest has at least ``difficulty`` leading zero hex digits exactly
+    when its big-endian integer value is below this bound.
+    
+    Args:
+        difficulty: Number of leading zeros required in hash
+    
+    Returns:
+        Integer target to compare digests against
+    
+    Raises:
+        ValueError: If difficulty is outside 0..64 (a hash has 64 hex digits)
+    """
+    if not 0 <= difficulty <= 64:
+        raise ValueError(f"difficulty must be between 0 and 64, got {difficulty}")
+    return 1 << (256 - 4 * difficulty)
+
+
+def find_nonce(
+    prefix: bytes,
+    suffix: bytes,
+    difficulty: int,
+    start: int = 0,
+    step: int = 1,
+    stop_event: Any = None
+) -> Optional[Tuple[int, str]]:
+    """
+    Search for a nonce whose hash meets the difficulty requirement.
+    
+    The serialized block is split around the nonce so the constant parts
+    are encoded once and only the nonce digits change per attempt. The
+    prefix is absorbed into a SHA-256 midstate up front; each attempt copies
+    that state and hashes only the nonce digits and suffix.
+    
+    Args:
+        prefix: Serialized block data preceding the nonce
+        suffix: Serialized block data following the nonce
+        difficulty: Number of leading zeros required in hash
+        start: First nonce to try
+        step: Increment between attempted nonces
+        stop_event: Optional event polled every NONCE_POLL_INTERVAL attempts;
+            the search gives up once it is set
+    
+    Returns:
+        Tuple of (nonce, hexadecimal hash) for the first match, or None if
+        the search was stopped
+    """
+    # Hoist everything the inner loop touches into locals
+    copy_midstate = sha256(prefix).copy
+    tail_format = b'%d' + suffix.replace(b'%', b'%%')
+    target = difficulty_target(difficulty)
+    from_bytes = int.from_bytes
+    nonce = start
+    while True:
+        stop = nonce + step * NONCE_POLL_INTERVAL
+        for nonce in range(nonce, stop, step):
+            attempt = copy_midstate()
+            attempt.update(tail_format % nonce)
+            if from_bytes(attempt.digest(), 'big') < target:
+                return nonce, attempt.hexdigest()
+        nonce = stop
+        if stop_event is not None and stop_event.is_set():
+            return None
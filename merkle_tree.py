@@ -1,8 +1,94 @@
+import threading
+from collections import OrderedDict
 from typing import List, Optional
-from hash_utils import calculate_hash
+from hash_utils import sha256_64b, sha256_64b_batch
 from transaction import Transaction
 
 
+# Upper bound on interior node digests remembered across trees
+MERKLE_CACHE_SIZE = 1 << 16
+
+# Least-recently-used cache of parent digests keyed by left || right
+_merkle_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+# Serializes access to _merkle_cache so trees can be built from several
+# threads; hashing itself happens outside the lock
+_merkle_cache_lock = threading.Lock()
+
+
+def _cache_store(pair: bytes, digest: bytes) -> None:
+    """
+    Remember a parent digest, evicting the least recently used entries.
+    Callers must hold _merkle_cache_lock.
+    
+    Args:
+        pair: Left digest followed by right digest (64 bytes)
+        digest: Raw 32-byte parent digest
+    """
+    _merkle_cache[pair] = digest
+    while len(_merkle_cache) > MERKLE_CACHE_SIZE:
+        _merkle_cache.popitem(last=False)
+
+
+def _hash_pair(pair: bytes) -> bytes:
+    """
+    Hash two concatenated child digests into their parent digest.
+    
+    Results are memoized so rebuilding or re-verifying unchanged subtrees
+    costs a cache lookup rather than a SHA-256 computation.
+    
+    Args:
+        pair: Left digest followed by right digest (64 bytes)
+    
+    Returns:
+        Raw 32-byte parent digest
+    """
+    with _merkle_cache_lock:
+        digest = _merkle_cache.get(pair)
+        if digest is not None:
+            _merkle_cache.move_to_end(pair)
+            return digest
+    
+    digest = sha256_64b(pair)
+    with _merkle_cache_lock:
+        _cache_store(pair, digest)
+    return digest
+
+
+def _hash_level(pairs: List[bytes]) -> List[bytes]:
+    """
+    Hash every sibling pair of a tree level into its parent digest.
+    
+    Cached parents are looked up; all cache misses are hashed together in a
+    single sha256_64b_batch call.
+    
+    Args:
+        pairs: Concatenated left || right digests for the level
+    
+    Returns:
+        Raw 32-byte parent digests in the same order as the pairs
+    """
+    cache = _merkle_cache
+    with _merkle_cache_lock:
+        parents = [cache.get(pair) for pair in pairs]
+    misses = [i for i, digest in enumerate(parents) if digest is None]
+    
+    if misses:
+        digests = sha256_64b_batch(pairs[i] for i in misses)
+        for i, digest in zip(misses, digests):
+            parents[i] = digest
+    
+    # Refresh hits and store misses only after the level is complete, so
+    # eviction cannot drop a digest this level still needs
+    with _merkle_cache_lock:
+        for pair, digest in zip(pairs, parents):
+            if pair in cache:
+                cache.move_to_end(pair)
+            else:
+                _cache_store(pair, digest)
+    return parents
+
+
 class MerkleTree:
     """
     Merkle Tree implementation for efficient transaction verification.
@@ -10,6 +96,10 @@ class MerkleTree:
     A Merkle Tree is a binary tree where each leaf is a transaction hash
     and each parent is the hash of its children. The root hash can verify
     the entire set of transactions efficiently.
+    
+    Nodes are kept as raw 32-byte digests so every parent hash covers a
+    single 64-byte input; hex strings are only produced for the root,
+    proofs and the printed structure.
     """
     
     def __init__(self, transactions: List[Transaction]):
@@ -20,7 +110,7 @@ class MerkleTree:
             transactions: List of transactions to include in tree
         """
         self.transactions = transactions
-        self.tree = []
+        self.tree: List[List[bytes]] = []
         self.root = self._build_tree()
     
     def _build_tree(self) -> str:
@@ -34,28 +124,29 @@ class MerkleTree:
             return '0' * 64  # Empty tree root
         
         # Create leaf hashes from transactions
-        leaves = [calculate_hash(tx.to_dict()) for tx in self.transactions]
+        leaves = [tx.leaf_hash() for tx in self.transactions]
         self.tree.append(leaves)
         
         # Build tree level by level
         current_level = leaves
+        join = b''.join
         while len(current_level) > 1:
-            next_level = []
+            n = len(current_level)
+            pairs: List[Optional[bytes]] = [None] * ((n + 1) // 2)
             
-            # Pair up hashes and compute parent hash
-            for i in range(0, len(current_level), 2):
-                if i + 1 < len(current_level):
-                    # Hash of two children
-                    parent = calculate_hash(current_level[i] + current_level[i + 1])
-                else:
-                    # Odd number of nodes, duplicate last hash
-                    parent = calculate_hash(current_level[i] + current_level[i])
-                next_level.append(parent)
+            # Pair up hashes, duplicating the last one on odd levels
+            for i in range(0, n, 2):
+                left = current_level[i]
+                right = current_level[i + 1] if i + 1 < n else left
+                pairs[i >> 1] = join((left, right))
+            
+            # Hash the whole level at once
+            next_level = _hash_level(pairs)
             
             self.tree.append(next_level)
             current_level = next_level
         
-        return current_level[0]
+        return current_level[0].hex()
     
     def get_proof(self, tx_index: int) -> List[tuple]:
         """
@@ -65,7 +156,7 @@ class MerkleTree:
             tx_index: Index of transaction to get proof for
         
         Returns:
-            List of (hash, position) tuples needed to verify the transaction
+            List of (hex hash, position) tuples needed to verify the transaction
         """
         if tx_index >= len(self.transactions):
             return []
@@ -78,10 +169,13 @@ class MerkleTree:
             if index % 2 == 0:
                 # Current node is left child
                 if index + 1 < len(level):
-                    proof.append((level[index + 1], 'right'))
+                    proof.append((level[index + 1].hex(), 'right'))
+                else:
+                    # Last node of an odd level is paired with itself
+                    proof.append((level[index].hex(), 'right'))
             else:
                 # Current node is right child
-                proof.append((level[index - 1], 'left'))
+                proof.append((level[index - 1].hex(), 'left'))
             
             index = index // 2
         
@@ -103,17 +197,22 @@ class MerkleTree:
         
         # Calculate leaf hash
         tx = self.transactions[tx_index]
-        current_hash = calculate_hash(tx.to_dict())
+        current_hash = tx.leaf_hash()
         
         # Traverse proof and recalculate root
-        for proof_hash, position in proof:
-            if position == 'left':
-                current_hash = calculate_hash(proof_hash + current_hash)
-            else:  # position == 'right'
-                current_hash = calculate_hash(current_hash + proof_hash)
+        try:
+            for proof_hash, position in proof:
+                sibling = bytes.fromhex(proof_hash)
+                if position == 'left':
+                    current_hash = _hash_pair(sibling + current_hash)
+                else:  # position == 'right'
+                    current_hash = _hash_pair(current_hash + sibling)
+        except (TypeError, ValueError):
+            # Malformed proof entry (not a hex string of a 32-byte digest)
+            return False
         
         # Verify root matches
-        return current_hash == self.root
+        return current_hash.hex() == self.root
     
     def get_tree_structure(self) -> str:
         """
@@ -126,6 +225,6 @@ class MerkleTree:
         for level_idx, level in enumerate(self.tree):
             result += f"Level {level_idx}: "
             for hash_val in level:
-                result += f"{hash_val[:8]}... "
+                result += f"{hash_val.hex()[:8]}... "
             result += "\n"
         return result
@@ -1,6 +1,8 @@
-from datetime import datetime
-from typing import Optional, Dict, Any
+from decimal import Decimal
+from typing import Optional, Dict, Any, Union
 import json
+import time
+from hash_utils import encode_transaction, sha256
 
 
 class Transaction:
@@ -10,17 +12,33 @@ class Transaction:
     Attributes:
         sender (str): Address or ID of the sender
         receiver (str): Address or ID of the receiver
-        amount (float): Amount being transferred
-        timestamp (str): When the transaction occurred
+        amount (int): Amount being transferred, in minor units
+        timestamp (int): When the transaction occurred (nanoseconds since epoch)
         transaction_id (Optional[str]): Unique identifier for the transaction
+    
+    Amounts are stored as integers in minor units, DECIMALS places below
+    the whole unit (like satoshis), so they encode and compare exactly.
+    
+    The canonical encoding and leaf hash are computed lazily and cached;
+    reassigning any hashed field discards the cache.
     """
     
+    __slots__ = (
+        'sender', 'receiver', 'amount', 'timestamp', 'transaction_id',
+        '_cached_json', '_cached_hash'
+    )
+    
+    # Number of decimal places between a whole unit and a minor unit
+    DECIMALS = 8
+    
+    _HASHED_FIELDS = frozenset(('sender', 'receiver', 'amount', 'timestamp'))
+    
     def __init__(
         self,
         sender: str,
         receiver: str,
-        amount: float,
-        timestamp: Optional[str] = None,
+        amount: Union[int, Decimal],
+        timestamp: Optional[int] = None,
         transaction_id: Optional[str] = None
     ):
         """
@@ -29,15 +47,53 @@ class Transaction:
         Args:
             sender: Who is sending
             receiver: Who is receiving
-            amount: How much is being sent
+            amount: How much is being sent, in whole units (int or Decimal)
             timestamp: When the transaction happened (defaults to now)
             transaction_id: Optional ID (can be auto-generated)
+        
+        Raises:
+            TypeError: If amount is not an int or Decimal, or timestamp is
+                given and is not an int
+            ValueError: If amount is not finite, out of range or more precise
+                than one minor unit
         """
+        if timestamp is None:
+            timestamp = time.time_ns()
+        elif type(timestamp) is not int:
+            raise TypeError(
+                f"timestamp must be int nanoseconds, got {type(timestamp).__name__}"
+            )
+        if type(amount) is not int and not isinstance(amount, Decimal):
+            raise TypeError(
+                f"amount must be int or Decimal, got {type(amount).__name__}"
+            )
+        if isinstance(amount, Decimal) and not amount.is_finite():
+            raise ValueError(f"amount must be finite, got {amount}")
+        try:
+            minor_units = Decimal(amount).scaleb(self.DECIMALS)
+        except ArithmeticError:
+            raise ValueError(f"amount {amount} is out of range") from None
+        if minor_units != minor_units.to_integral_value():
+            raise ValueError(
+                f"amount {amount} has more than {self.DECIMALS} decimal places"
+            )
+        
         self.sender = sender
         self.receiver = receiver
-        self.amount = amount
-        self.timestamp = timestamp or datetime.now().isoformat()
+        self.amount = int(minor_units)
+        self.timestamp = timestamp
         self.transaction_id = transaction_id
+        self._cached_json: Optional[bytes] = None
+        self._cached_hash: Optional[bytes] = None
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Set an attribute, invalidating cached hashes if a hashed field changes.
+        """
+        if name in self._HASHED_FIELDS:
+            object.__setattr__(self, '_cached_json', None)
+            object.__setattr__(self, '_cached_hash', None)
+        object.__setattr__(self, name, value)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -62,6 +118,39 @@ class Transaction:
         """
         return json.dumps(self.to_dict(), sort_keys=True)
     
+    def amount_decimal(self) -> Decimal:
+        """
+        Get the amount in whole units.
+        
+        Returns:
+            Amount as an exact Decimal
+        """
+        return Decimal(self.amount).scaleb(-self.DECIMALS)
+    
+    def canonical_json(self) -> bytes:
+        """
+        Get the compact, key-sorted JSON encoding used for hashing.
+        
+        Returns:
+            Canonical UTF-8 encoded JSON bytes
+        """
+        if self._cached_json is None:
+            self._cached_json = encode_transaction(
+                self.sender, self.receiver, self.amount, self.timestamp
+            )
+        return self._cached_json
+    
+    def leaf_hash(self) -> bytes:
+        """
+        Get the SHA-256 digest of the canonical encoding (Merkle leaf).
+        
+        Returns:
+            Raw 32-byte digest
+        """
+        if self._cached_hash is None:
+            self._cached_hash = sha256(self.canonical_json()).digest()
+        return self._cached_hash
+    
     def is_valid(self) -> bool:
         """
         Validate transaction data.
@@ -87,12 +176,14 @@ class Transaction:
         """
         String representation of transaction.
         """
+        amount = self.amount_decimal().normalize()
         return (f"Transaction({self.sender} -> {self.receiver}: "
-                f"{self.amount} @ {self.timestamp})")
+                f"{amount:f} @ {self.timestamp})")
     
     def __str__(self) -> str:
         """
         Human-readable string representation.
         """
-        return (f"{self.sender} sends {self.amount} to {self.receiver}"
+        amount = self.amount_decimal().normalize()
+        return (f"{self.sender} sends {amount:f} to {self.receiver}"
                 f" on {self.timestamp}")